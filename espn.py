@@ -0,0 +1,512 @@
+import time
+import random
+import functools
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard library parser
+    orjson = None
+
+# ------------------ HTTP SESSION ------------------
+
+SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
+LEADERS_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/leaders"
+TEAMS_URL = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams"
+
+ESPN_BACKOFF_MAX = 8.0   # Never wait longer than this between ESPN retries
+BACKGROUND_TIMEOUT = 3   # Per-request timeout for best-effort background refreshes
+
+# Flags executor threads running best-effort refreshes (see submit_background)
+_background = threading.local()
+
+
+def _in_background() -> bool:
+    return getattr(_background, "active", False)
+
+
+# Recent ESPN status codes, used to tune retry delays. Executor threads write
+# to it concurrently, so every access goes through the lock.
+_espn_health = deque(maxlen=50)
+_espn_health_lock = threading.Lock()
+
+
+def _record_espn_status(status: int):
+    with _espn_health_lock:
+        _espn_health.append(status)
+
+
+def _espn_success_rate() -> float:
+    """Fraction of recent ESPN responses that succeeded (1.0 with no history)."""
+    with _espn_health_lock:
+        statuses = list(_espn_health)
+    if not statuses:
+        return 1.0
+    return sum(1 for status in statuses if status < 400) / len(statuses)
+
+
+class AdaptiveRetry(Retry):
+    """
+    Retry policy with jittered exponential backoff that stretches when ESPN
+    has been failing a lot recently and stays short when failures are rare.
+    Retry-After headers still take precedence. Background refreshes get no
+    retries at all, so they can never hold up the process for long.
+    """
+
+    def is_exhausted(self) -> bool:
+        return super().is_exhausted() or (_in_background() and bool(self.history))
+
+    def increment(self, method=None, url=None, response=None, *args, **kwargs):
+        if response is not None:
+            _record_espn_status(response.status)
+        return super().increment(method, url, response, *args, **kwargs)
+
+    def get_backoff_time(self) -> float:
+        attempts = len(self.history)
+        if attempts == 0:
+            return 0
+        delay = self.backoff_factor * (2 ** (attempts - 1)) * random.uniform(0.5, 1.5)
+        return min(ESPN_BACKOFF_MAX, delay / max(_espn_success_rate(), 0.25))
+
+
+def _record_espn_response(response, *args, **kwargs):
+    _record_espn_status(response.status_code)
+
+
+# Shared session so every ESPN call reuses pooled keep-alive connections
+# instead of paying a fresh TCP + TLS handshake per request.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=AdaptiveRetry(
+            total=4,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+    )
+)
+SESSION.hooks["response"].append(_record_espn_response)
+
+
+def _get_json(url: str, params: Optional[dict] = None):
+    """GETs an ESPN endpoint through the shared session and parses the JSON body."""
+    timeout = BACKGROUND_TIMEOUT if _in_background() else 10
+    response = SESSION.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+DIVIDER = "=" * 50
+
+
+@functools.lru_cache(maxsize=64)
+def _category_label(category: str) -> str:
+    """Display label for a leader category, computed once per distinct category."""
+    return category.replace("passing", "Passing ").replace("rushing", "Rushing ").replace("receiving", "Receiving ")
+
+
+# Worker pool for issuing independent ESPN requests concurrently
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+
+def submit_background(func, *args) -> Future:
+    """
+    Runs func on the executor as a best-effort refresh: no retries and a short
+    timeout, so a slow ESPN can't keep the process alive long after exit.
+    """
+    def task():
+        _background.active = True
+        try:
+            return func(*args)
+        finally:
+            _background.active = False
+    return EXECUTOR.submit(task)
+
+
+def warm_connection():
+    """Opens a pooled TLS connection to ESPN ahead of the first real request."""
+    try:
+        SESSION.head(SCOREBOARD_URL, timeout=BACKGROUND_TIMEOUT)
+    except requests.exceptions.RequestException:
+        pass  # Warmup is best effort; the real request will retry
+
+
+# ------------------ RESPONSE CACHING ------------------
+
+SCOREBOARD_TTL = 60   # Scores move minute to minute
+LEADERS_TTL = 300     # Leaderboards and team data change far less often
+TEAMS_TTL = 3600      # The list of teams is effectively static
+
+
+def ttl_cache(ttl: float, maxsize: int = 32):
+    """
+    Memoizes a function's return value per argument tuple for `ttl` seconds.
+    Exceptions are never cached, so a failed fetch is retried on the next call.
+    Concurrent misses for the same arguments share a single call.
+    """
+    def decorator(func):
+        cache = {}
+        in_flight = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+                if hit and hit[0] > now:
+                    return hit[1]
+                owner = args not in in_flight
+                if owner:
+                    in_flight[args] = (Future(), _in_background())
+                pending, pending_in_background = in_flight[args]
+
+            if not owner:
+                # Another thread is already computing this entry; share its result
+                try:
+                    return pending.result()
+                except Exception:
+                    # A no-retry background attempt failing shouldn't fail a
+                    # foreground caller, which gets its own full attempt
+                    if not pending_in_background or _in_background():
+                        raise
+                return wrapper(*args)
+
+            try:
+                value = func(*args)
+            except BaseException as e:
+                with lock:
+                    del in_flight[args]
+                pending.set_exception(e)
+                raise
+
+            with lock:
+                if len(cache) >= maxsize:
+                    # Drop expired entries first, then the oldest if still full
+                    for key in [k for k, (exp, _) in cache.items() if exp <= now]:
+                        del cache[key]
+                    if len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                cache[args] = (now + ttl, value)
+                del in_flight[args]
+            pending.set_result(value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+@ttl_cache(ttl=LEADERS_TTL)
+def _leaders_index(limit: int) -> dict:
+    """
+    ESPN league leaders for a given limit, keyed by lowercase category name
+    with spaces removed. Built once per TTL window so each lookup is a dict
+    hit instead of a scan over every category in the payload.
+    """
+    index = {}
+    for cat_data in _get_json(LEADERS_URL, params={"limit": limit}).get("leaders", []):
+        index.setdefault(cat_data.get("name", "").lower().replace(" ", ""), cat_data)
+    return index
+
+
+@ttl_cache(ttl=TEAMS_TTL)
+def _fetch_teams() -> list:
+    """List of all NFL team objects, cached since it almost never changes."""
+    data = _get_json(TEAMS_URL)
+    return data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
+
+
+# ------------------ LIVE DATA TOOLS ------------------
+
+def _format_game(event: dict) -> str:
+    """Formats one scoreboard event as a single 'away @ home - status' line."""
+    status_detail = event.get("status", {}).get("type", {}).get("detail", "Status unknown")
+    competitors = event.get("competitions", [{}])[0].get("competitors", [])
+    
+    if len(competitors) < 2:
+        return f"🏈 {event.get('name', 'Unknown matchup')} - {status_detail}"
+    
+    home, away = competitors[0], competitors[1]
+    away_team = away.get("team", {}).get("displayName", "Team A")
+    home_team = home.get("team", {}).get("displayName", "Team B")
+    return (f"🏈 {away_team} {away.get('score', '0')} @ "
+            f"{home_team} {home.get('score', '0')} - {status_detail}")
+
+
+@ttl_cache(ttl=SCOREBOARD_TTL)
+def scoreboard_summary() -> str:
+    """
+    Formatted scoreboard, cached as text so the JSON is only fetched and
+    walked once per TTL window. Errors propagate and are not cached.
+    """
+    events = _get_json(SCOREBOARD_URL).get("events", [])
+    if not events:
+        return "No games scheduled or completed recently. The regular season has ended."
+    return "\n".join([_format_game(event) for event in events])
+
+
+def get_nfl_scoreboard() -> str:
+    """
+    Fetches the latest NFL scores and game schedules from ESPN API.
+    Returns formatted string with game information including teams, scores, and status.
+    """
+    try:
+        return scoreboard_summary()
+    
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching scoreboard data: {str(e)}"
+    except Exception as e:
+        return f"Unexpected error processing scoreboard: {str(e)}"
+
+
+# Natural-language category names mapped to ESPN's category identifiers
+CATEGORY_MAPPING = {
+    "passing yards": "passingYards",
+    "passing touchdowns": "passingTouchdowns",
+    "passing tds": "passingTouchdowns",
+    "passer rating": "passingRating",
+    "qbr": "passingRating",
+    "rushing yards": "rushingYards",
+    "rushing touchdowns": "rushingTouchdowns",
+    "rushing tds": "rushingTouchdowns",
+    "receiving yards": "receivingYards",
+    "receiving touchdowns": "receivingTouchdowns",
+    "receiving tds": "receivingTouchdowns",
+    "receptions": "receptions",
+    "catches": "receptions",
+    "picks": "interceptions",
+    "ints": "interceptions",
+    "sacks": "sacks",
+    "tackles": "tackles"
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_category(category: str) -> str:
+    """Resolves a user- or model-supplied category name to ESPN's identifier."""
+    return CATEGORY_MAPPING.get(category.lower(), category)
+
+
+class UnknownCategoryError(LookupError):
+    """Raised when the leaders payload has no category matching the request."""
+
+
+def league_leaders_summary(category: str, limit: int = 10) -> str:
+    """
+    Formatted leader board for one category. Unlike get_league_leaders this
+    raises on fetch errors (and UnknownCategoryError for an unknown category)
+    instead of returning an error message.
+    """
+    normalized_category = _normalize_category(category)
+    limit = min(max(1, limit), 25)  # Ensure limit is between 1 and 25
+    
+    index = _leaders_index(limit)
+    search_term = normalized_category.lower()
+    
+    # Find the matching category in the leaders data
+    target_leaders = index.get(search_term, {}).get("leaders", [])
+    
+    if not target_leaders:
+        # Try to find by abbreviation or alternative matching
+        target_leaders = next(
+            (cat_data.get("leaders", []) for cat_data in index.values()
+             if search_term in cat_data.get("name", "").lower()),
+            None
+        )
+    
+    if not target_leaders:
+        available = [cat.get("displayName", "") for cat in index.values()]
+        raise UnknownCategoryError(f"Could not find leaders for '{category}'. "
+                                   f"Try one of these: {', '.join(available[:5])}")
+    
+    results = []
+    for i, leader in enumerate(target_leaders[:limit], 1):
+        player_name = leader.get("athlete", {}).get("displayName", "Unknown Player")
+        team_name = leader.get("team", {}).get("abbreviation", "N/A")
+        stat_value = leader.get("displayValue", leader.get("value", "N/A"))
+        results.append(f"{i}. {player_name} ({team_name}): {stat_value}")
+    
+    category_display = _category_label(normalized_category)
+    header = f"📊 Top {limit} NFL Leaders - {category_display}\n{DIVIDER}"
+    return header + "\n" + "\n".join(results)
+
+
+def get_league_leaders(category: str, limit: int = 10) -> str:
+    """
+    Fetches top NFL statistical leaders for a specific category.
+    
+    Args:
+        category: Statistical category to fetch. Supported values:
+                 - 'passingYards', 'passingTouchdowns', 'passingRating'
+                 - 'rushingYards', 'rushingTouchdowns'
+                 - 'receivingYards', 'receivingTouchdowns', 'receptions'
+                 - 'sacks', 'interceptions', 'tackles'
+        limit: Number of leaders to return (default: 10, max: 25)
+    
+    Returns:
+        Formatted string with player rankings, names, teams, and stat values.
+    """
+    try:
+        return league_leaders_summary(category, limit)
+    
+    except UnknownCategoryError as e:
+        return str(e)
+    except requests.exceptions.RequestException as e:
+        return f"Error fetching league leaders: {str(e)}"
+    except Exception as e:
+        return f"Unexpected error processing leaders data: {str(e)}"
+
+
+def get_team_stats(team_name: str) -> str:
+    """
+    Fetches current season statistics for a specific NFL team.
+    
+    Args:
+        team_name: Name or abbreviation of the team (e.g., 'Patriots', 'NE', 'Seahawks', 'SEA')
+    
+    Returns:
+        Formatted string with team record, standings, and key statistics.
+    """
+    try:
+        # The team list is cached, so usually only the detail request hits the network
+        teams = _fetch_teams()
+        
+        # Find matching team
+        target_team = None
+        search_term = team_name.lower()
+        
+        for team_obj in teams:
+            team = team_obj.get("team", {})
+            name = team.get("displayName", "").lower()
+            abbr = team.get("abbreviation", "").lower()
+            location = team.get("location", "").lower()
+            
+            if search_term in name or search_term == abbr or search_term in location:
+                target_team = team
+                break
+        
+        if not target_team:
+            return f"Could not find team matching '{team_name}'. Please check the team name and try again."
+        
+        # Get detailed team info
+        team_id = target_team.get("id")
+        detail_url = f"{TEAMS_URL}/{team_id}"
+        
+        detail_data = _get_json(detail_url)
+        
+        team_info = detail_data.get("team", {})
+        team_display = team_info.get("displayName", team_name)
+        
+        # Extract record
+        record = team_info.get("record", {}).get("items", [{}])[0]
+        wins = record.get("stats", [{}])[0].get("value", 0)
+        losses = record.get("stats", [{}])[1].get("value", 0) if len(record.get("stats", [])) > 1 else 0
+        
+        result = f"🏈 {team_display}\n{DIVIDER}\n"
+        result += f"Record: {int(wins)}-{int(losses)}\n"
+        
+        # Add more stats if available
+        next_event = team_info.get("nextEvent")
+        if next_event:
+            result += f"\nNext Game: {next_event[0].get('name', 'TBD')}"
+        
+        return result
+    
+    except Exception as e:
+        return f"Error fetching team stats for '{team_name}': {str(e)}"
+
+
+def get_multiple_team_stats(team_names: list[str]) -> str:
+    """
+    Fetches current season statistics for several NFL teams at once.
+    Use this instead of repeated get_team_stats calls when comparing teams.
+    
+    Args:
+        team_names: Names or abbreviations of the teams (e.g., ['Patriots', 'SEA'])
+    
+    Returns:
+        Formatted string with each team's record and key statistics.
+    """
+    # Warm the shared team list once so the workers don't all fetch it
+    try:
+        _fetch_teams()
+    except Exception:
+        pass
+    
+    # Team detail requests are independent, so issue them concurrently
+    results = EXECUTOR.map(get_team_stats, team_names)
+    return "\n\n".join(results)
+
+
+def search_player_stats(player_name: str) -> str:
+    """
+    Searches for a specific player and returns their current season statistics.
+    
+    Args:
+        player_name: Name of the player to search for
+    
+    Returns:
+        Formatted string with player information and statistics.
+    """
+    # ESPN player search endpoint
+    search_url = "https://site.api.espn.com/apis/common/v3/search"
+    params = {
+        "query": player_name,
+        "limit": 5,
+        "type": "player",
+        "sport": "football",
+        "league": "nfl"
+    }
+    
+    try:
+        data = _get_json(search_url, params=params)
+        
+        results = data.get("results", [])
+        if not results:
+            return f"No player found matching '{player_name}'. Please check the spelling and try again."
+        
+        # Get the first matching player
+        player = results[0]
+        player_display = player.get("displayName", player_name)
+        player_id = player.get("id")
+        team = player.get("team", {}).get("abbreviation", "N/A")
+        position = player.get("position", {}).get("abbreviation", "N/A")
+        
+        output = f"👤 {player_display}\n{DIVIDER}\n"
+        output += f"Team: {team} | Position: {position}\n"
+        
+        # Try to get detailed player stats
+        if player_id:
+            stats_url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/athletes/{player_id}"
+            try:
+                stats_data = _get_json(stats_url)
+                
+                # Extract season stats if available
+                athlete_stats = stats_data.get("athlete", {}).get("statistics", [])
+                if athlete_stats:
+                    output += "\n2025 Season Stats:\n"
+                    for stat in athlete_stats[:5]:  # Show top 5 stats
+                        stat_name = stat.get("displayName", "")
+                        stat_value = stat.get("displayValue", "")
+                        if stat_name and stat_value:
+                            output += f"  • {stat_name}: {stat_value}\n"
+            except:
+                pass  # Stats not critical, continue without them
+        
+        return output
+    
+    except Exception as e:
+        return f"Error searching for player '{player_name}': {str(e)}"
@@ -1,10 +1,33 @@
 import os
-import requests
+import re
+import json
+import time
+import math
+import random
+import sqlite3
+import hashlib
 from google import genai
-from google.genai import types
+from google.genai import types, errors
 from dotenv import load_dotenv
 from datetime import datetime
 from typing import Optional
+from collections import OrderedDict, deque
+from concurrent.futures import wait
+
+# ESPN access (pooled session, retries, caching and the Gemini tool functions)
+# lives in espn.py so every entry point shares one connection pool and cache
+from espn import (
+    EXECUTOR,
+    submit_background,
+    warm_connection,
+    scoreboard_summary,
+    league_leaders_summary,
+    get_nfl_scoreboard,
+    get_league_leaders,
+    get_team_stats,
+    get_multiple_team_stats,
+    search_player_stats,
+)
 
 load_dotenv()
 
@@ -16,6 +39,7 @@ if not API_KEY:
 
 # Initialize the Gemini Client
 client = genai.Client(api_key=API_KEY)
+MODEL = "gemini-2.0-flash-exp"
 
 # Context: February 2026 - Super Bowl LX
 CURRENT_DATE = "February 4, 2026"
@@ -29,267 +53,365 @@ SEASON_CONTEXT = (
     "If asked about top lists (top 5, top 10, etc.), use the league leaders tool or provide analysis based on available data."
 )
 
-# ------------------ LIVE DATA TOOLS ------------------
+# Fingerprint of the system prompt, computed once for cache keys and rows
+PROMPT_VERSION = hashlib.sha256(SEASON_CONTEXT.encode()).hexdigest()[:12]
+
+# ------------------ INTENT DETECTION ------------------
+
+# One compiled pattern classifies a message in a single pass over the text
+INTENT_RE = re.compile(
+    r"\b(?:"
+    r"(?P<passing>passing yards)"
+    r"|(?P<rushing>rushing yards)"
+    r"|(?P<receiving>receiving yards)"
+    r"|(?P<scoreboard>weeks?|latest|playoffs?|scores?|champions?(?:hips?)?)"
+    r")\b",
+    re.IGNORECASE
+)
+
+EXIT_COMMANDS = frozenset({"exit", "quit", "bye", "goodbye"})
+
+
+def detect_intent(user_input: str) -> str:
+    """Classifies a message as 'passing', 'rushing', 'receiving', 'scoreboard' or 'general'."""
+    match = INTENT_RE.search(user_input)
+    return match.lastgroup if match else "general"
+
 
-def get_nfl_scoreboard() -> str:
+# ------------------ LIVE DATA PREFETCH ------------------
+
+PREFETCH_TIMEOUT = 3.0   # Seconds to wait for prefetched data before asking Gemini
+
+
+def _leader_boards() -> str:
+    """Passing, rushing and receiving leaders as one block of text; raises on fetch errors."""
+    return "\n\n".join(
+        league_leaders_summary(category)
+        for category in ("passingYards", "rushingYards", "receivingYards")
+    )
+
+
+def prefetch_live_context() -> str:
     """
-    Fetches the latest NFL scores and game schedules from ESPN API.
-    Returns formatted string with game information including teams, scores, and status.
+    Fetches the scoreboard and the main leader boards in parallel so Gemini
+    can answer from the prompt instead of making tool calls one at a time.
+    Anything that failed or isn't ready within PREFETCH_TIMEOUT is left out
+    (slow fetches keep running and land in the TTL cache for later turns).
     """
-    url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        events = data.get("events", [])
-        if not events:
-            return "No games scheduled or completed recently. The regular season has ended."
-        
-        results = []
-        for event in events:
-            game_name = event.get("name", "Unknown matchup")
-            status_detail = event.get("status", {}).get("type", {}).get("detail", "Status unknown")
-            
-            competition = event.get("competitions", [{}])[0]
-            competitors = competition.get("competitors", [])
-            
-            if len(competitors) >= 2:
-                away_team = competitors[1].get("team", {}).get("displayName", "Team A")
-                away_score = competitors[1].get("score", "0")
-                home_team = competitors[0].get("team", {}).get("displayName", "Team B")
-                home_score = competitors[0].get("score", "0")
-                
-                game_info = f"🏈 {away_team} {away_score} @ {home_team} {home_score} - {status_detail}"
-                results.append(game_info)
-            else:
-                results.append(f"🏈 {game_name} - {status_detail}")
-        
-        return "\n".join(results)
-    
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching scoreboard data: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error processing scoreboard: {str(e)}"
+    futures = warm_live_data()
+    wait(futures, timeout=PREFETCH_TIMEOUT)
+    return "\n\n".join(f.result() for f in futures if f.done() and not f.exception())
 
 
-def get_league_leaders(category: str, limit: int = 10) -> str:
+def warm_live_data() -> list:
     """
-    Fetches top NFL statistical leaders for a specific category.
-    
-    Args:
-        category: Statistical category to fetch. Supported values:
-                 - 'passingYards', 'passingTouchdowns', 'passingRating'
-                 - 'rushingYards', 'rushingTouchdowns'
-                 - 'receivingYards', 'receivingTouchdowns', 'receptions'
-                 - 'sacks', 'interceptions', 'tackles'
-        limit: Number of leaders to return (default: 10, max: 25)
-    
-    Returns:
-        Formatted string with player rankings, names, teams, and stat values.
+    Starts refreshing the scoreboard and leader caches in the background and
+    returns the futures. Fresh cache entries make this a cheap no-op, and a
+    refresh already in flight is joined rather than fetched again.
+    """
+    # All leader boards come from one cached payload, so they share a worker
+    # rather than racing to fetch the same URL three times
+    return [submit_background(scoreboard_summary), submit_background(_leader_boards)]
+
+
+# ------------------ LLM RESPONSE CACHE ------------------
+
+EXACT_CACHE_TTL = 3600
+EXACT_CACHE_MAXSIZE = 512
+CACHE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".nfl_cache.sqlite3")
+
+# Maps prompt hash -> (expires_at, response text), kept in LRU order
+_exact_cache = OrderedDict()
+
+
+class CacheBackend:
+    """
+    SQLite store for LLM answers so the exact-match cache survives restarts.
+    Any database error disables persistence rather than breaking the chat.
+    """
+
+    def __init__(self, path: str):
+        try:
+            self.db = sqlite3.connect(path, check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "input_hash TEXT PRIMARY KEY, prompt_version TEXT, model TEXT, "
+                "response TEXT, created_at INT, expires_at INT)"
+            )
+            self.db.execute("DELETE FROM llm_cache WHERE expires_at < ?", (int(time.time()),))
+            self.db.commit()
+        except sqlite3.Error:
+            self.db = None
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Returns (expires_at, response) for a fresh entry, or None."""
+        if not self.db:
+            return None
+        try:
+            row = self.db.execute(
+                "SELECT expires_at, response FROM llm_cache WHERE input_hash = ? AND expires_at >= ?",
+                (key, int(time.time()))
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (float(row[0]), row[1]) if row else None
+
+    def set(self, key: str, response: str, expires_at: float):
+        if not self.db:
+            return
+        try:
+            self.db.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, PROMPT_VERSION, MODEL, response, int(time.time()), int(expires_at))
+            )
+            self.db.commit()
+        except sqlite3.Error:
+            pass
+
+
+CACHE_BACKEND = CacheBackend(CACHE_DB_PATH)
+
+
+def _cache_key(user_input: str, history: list) -> str:
     """
-    # Normalize category names
-    category_mapping = {
-        "passing yards": "passingYards",
-        "passing touchdowns": "passingTouchdowns",
-        "passing tds": "passingTouchdowns",
-        "passer rating": "passingRating",
-        "qbr": "passingRating",
-        "rushing yards": "rushingYards",
-        "rushing touchdowns": "rushingTouchdowns",
-        "rushing tds": "rushingTouchdowns",
-        "receiving yards": "receivingYards",
-        "receiving touchdowns": "receivingTouchdowns",
-        "receiving tds": "receivingTouchdowns",
-        "receptions": "receptions",
-        "catches": "receptions",
-        "picks": "interceptions",
-        "ints": "interceptions",
-        "sacks": "sacks",
-        "tackles": "tackles"
+    Deterministic hash of everything that shapes the model's answer,
+    including the conversation so far, so follow-ups like "why?" only
+    match the same question asked at the same point of the same dialogue.
+    """
+    payload = {
+        "model": MODEL,
+        "sys": PROMPT_VERSION,
+        "history": [content.model_dump(mode="json", exclude_none=True) for content in history],
+        "msg": user_input.strip().lower()
     }
-    
-    normalized_category = category_mapping.get(category.lower(), category)
-    limit = min(max(1, limit), 25)  # Ensure limit is between 1 and 25
-    
-    url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/leaders"
-    params = {"limit": limit}
-    
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def lookup_exact_cache(key: str) -> Optional[str]:
+    """Returns the cached answer for an identical prompt, if still fresh."""
+    hit = _exact_cache.get(key)
+    if not hit:
+        # Fall back to answers persisted by earlier sessions
+        hit = CACHE_BACKEND.get(key)
+        if not hit:
+            return None
+        _exact_cache[key] = hit
+        if len(_exact_cache) > EXACT_CACHE_MAXSIZE:
+            _exact_cache.popitem(last=False)
+    if hit[0] < time.time():
+        del _exact_cache[key]
+        return None
+    _exact_cache.move_to_end(key)
+    return hit[1]
+
+
+def store_exact_cache(key: str, text: str):
+    """Caches an answer under its prompt hash, evicting the least recently used."""
+    if not text:
+        return
+    expires_at = time.time() + EXACT_CACHE_TTL
+    _exact_cache[key] = (expires_at, text)
+    _exact_cache.move_to_end(key)
+    CACHE_BACKEND.set(key, text, expires_at)
+    if len(_exact_cache) > EXACT_CACHE_MAXSIZE:
+        _exact_cache.popitem(last=False)
+
+
+def _used_live_data(response) -> bool:
+    """True if the model called any tools, making the answer time-sensitive."""
+    history = getattr(response, "automatic_function_calling_history", None) or []
+    return any(
+        part.function_call
+        for content in history
+        for part in (content.parts or [])
+    )
+
+
+EMBEDDING_MODEL = "text-embedding-004"
+SEMANTIC_THRESHOLD = 0.92   # Cosine similarity needed to reuse an answer
+SEMANTIC_TTL = 600          # Seconds a cached answer stays valid
+SEMANTIC_MAXSIZE = 256
+
+# Entries are (unit-length embedding, response text, timestamp)
+_semantic_cache = []
+
+
+def _embed(text: str) -> Optional[list]:
+    """Returns a unit-length embedding for text, or None if embedding fails."""
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        # Find the matching category in the leaders data
-        all_categories = data.get("leaders", [])
-        target_leaders = None
-        
-        for cat_data in all_categories:
-            if cat_data.get("name", "").lower().replace(" ", "") == normalized_category.lower():
-                target_leaders = cat_data.get("leaders", [])
-                break
-        
-        if not target_leaders:
-            # Try to find by abbreviation or alternative matching
-            for cat_data in all_categories:
-                if normalized_category.lower() in cat_data.get("name", "").lower():
-                    target_leaders = cat_data.get("leaders", [])
-                    break
-        
-        if not target_leaders:
-            available = [cat.get("displayName", "") for cat in all_categories]
-            return (f"Could not find leaders for '{category}'. "
-                   f"Try one of these: {', '.join(available[:5])}")
-        
-        results = []
-        for i, leader in enumerate(target_leaders[:limit], 1):
-            player_name = leader.get("athlete", {}).get("displayName", "Unknown Player")
-            team_name = leader.get("team", {}).get("abbreviation", "N/A")
-            stat_value = leader.get("displayValue", leader.get("value", "N/A"))
-            results.append(f"{i}. {player_name} ({team_name}): {stat_value}")
-        
-        category_display = normalized_category.replace("passing", "Passing ").replace("rushing", "Rushing ").replace("receiving", "Receiving ")
-        header = f"📊 Top {limit} NFL Leaders - {category_display}\n" + "="*50
-        return header + "\n" + "\n".join(results)
-    
-    except requests.exceptions.RequestException as e:
-        return f"Error fetching league leaders: {str(e)}"
-    except Exception as e:
-        return f"Unexpected error processing leaders data: {str(e)}"
+        result = client.models.embed_content(model=EMBEDDING_MODEL, contents=text)
+        values = result.embeddings[0].values
+    except Exception:
+        return None
+
+    norm = math.sqrt(sum(v * v for v in values))
+    return [v / norm for v in values] if norm else None
+
 
+def lookup_semantic_cache(embedding: Optional[list]) -> Optional[str]:
+    """Returns a cached answer to a sufficiently similar recent question, if any."""
+    if not embedding:
+        return None
 
-def get_team_stats(team_name: str) -> str:
+    now = time.time()
+    _semantic_cache[:] = [e for e in _semantic_cache if now - e[2] < SEMANTIC_TTL]
+
+    best_score, best_text = 0.0, None
+    for cached_embedding, text, _ in _semantic_cache:
+        # Both vectors are unit length, so the dot product is the cosine similarity
+        score = sum(a * b for a, b in zip(cached_embedding, embedding))
+        if score > best_score:
+            best_score, best_text = score, text
+
+    return best_text if best_score > SEMANTIC_THRESHOLD else None
+
+
+def store_semantic_cache(embedding: Optional[list], text: str):
+    """Remembers an answer under the embedding of the question that produced it."""
+    if not embedding or not text:
+        return
+    if len(_semantic_cache) >= SEMANTIC_MAXSIZE:
+        _semantic_cache.pop(0)
+    _semantic_cache.append((embedding, text, time.time()))
+
+
+# ------------------ GEMINI RATE LIMITING ------------------
+
+GEMINI_RPM = 10          # Requests per minute allowed for the flash model
+RATE_WINDOW = 60.0       # Sliding window length in seconds
+MAX_RATE_LIMIT_RETRIES = 2
+RATE_LIMIT_BASE_DELAY = 2.0   # First backoff when a 429 carries no retry delay
+
+
+class RateLimiter:
     """
-    Fetches current season statistics for a specific NFL team.
-    
-    Args:
-        team_name: Name or abbreviation of the team (e.g., 'Patriots', 'NE', 'Seahawks', 'SEA')
-    
-    Returns:
-        Formatted string with team record, standings, and key statistics.
+    Client-side pacing for Gemini calls.
+
+    Tracks request timestamps in a sliding window and adapts the allowed
+    rate with AIMD: halved on every 429, recovering by 0.5 per success.
+    Each 429 also blocks requests for the server's retry delay, or for a
+    jittered exponential backoff when the server doesn't give one.
     """
-    # Try to get team info from ESPN API
-    url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams"
-    
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        teams = data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
-        
-        # Find matching team
-        target_team = None
-        search_term = team_name.lower()
-        
-        for team_obj in teams:
-            team = team_obj.get("team", {})
-            name = team.get("displayName", "").lower()
-            abbr = team.get("abbreviation", "").lower()
-            location = team.get("location", "").lower()
-            
-            if search_term in name or search_term == abbr or search_term in location:
-                target_team = team
+
+    def __init__(self, rpm: int, window: float = RATE_WINDOW):
+        self.max_rate = float(rpm)
+        self.rate = float(rpm)
+        self.window = window
+        self.sent = deque()
+        self.blocked_until = 0.0
+        self.consecutive_limits = 0
+
+    def wait_time(self) -> float:
+        """Seconds until another request fits inside the current budget."""
+        now = time.monotonic()
+        while self.sent and now - self.sent[0] >= self.window:
+            self.sent.popleft()
+
+        delay = self.blocked_until - now
+        if len(self.sent) >= max(1, int(self.rate)):
+            delay = max(delay, self.sent[0] + self.window - now)
+        return max(0.0, delay)
+
+    def wait_if_throttled(self):
+        """Blocks until another request fits inside the current budget."""
+        while True:
+            delay = self.wait_time()
+            if delay <= 0:
                 break
-        
-        if not target_team:
-            return f"Could not find team matching '{team_name}'. Please check the team name and try again."
-        
-        # Get detailed team info
-        team_id = target_team.get("id")
-        detail_url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams/{team_id}"
-        
-        detail_response = requests.get(detail_url, timeout=10)
-        detail_data = detail_response.json()
-        
-        team_info = detail_data.get("team", {})
-        team_display = team_info.get("displayName", team_name)
-        
-        # Extract record
-        record = team_info.get("record", {}).get("items", [{}])[0]
-        wins = record.get("stats", [{}])[0].get("value", 0)
-        losses = record.get("stats", [{}])[1].get("value", 0) if len(record.get("stats", [])) > 1 else 0
-        
-        result = f"🏈 {team_display}\n" + "="*50 + "\n"
-        result += f"Record: {int(wins)}-{int(losses)}\n"
-        
-        # Add more stats if available
-        next_event = team_info.get("nextEvent")
-        if next_event:
-            result += f"\nNext Game: {next_event[0].get('name', 'TBD')}"
-        
-        return result
-    
-    except Exception as e:
-        return f"Error fetching team stats for '{team_name}': {str(e)}"
+            time.sleep(delay)
+
+        self.sent.append(time.monotonic())
+
+    def record_success(self):
+        self.rate = min(self.max_rate, self.rate + 0.5)
+        self.consecutive_limits = 0
 
+    def record_rate_limit(self, retry_after: Optional[float] = None):
+        self.rate = max(1.0, self.rate * 0.5)
+        if not retry_after:
+            retry_after = (RATE_LIMIT_BASE_DELAY * (2 ** self.consecutive_limits)
+                           * random.uniform(0.5, 1.5))
+        self.consecutive_limits += 1
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
 
-def search_player_stats(player_name: str) -> str:
+
+RATE_LIMITER = RateLimiter(GEMINI_RPM)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Extracts the server-suggested retry delay (e.g. 'retryDelay': '31s') from an API error."""
+    match = re.search(r"retryDelay['\"]?\s*:\s*['\"]?(\d+(?:\.\d+)?)s", str(error))
+    return float(match.group(1)) if match else None
+
+
+def stream_with_backpressure(chat, message: str):
     """
-    Searches for a specific player and returns their current season statistics.
-    
-    Args:
-        player_name: Name of the player to search for
-    
-    Returns:
-        Formatted string with player information and statistics.
+    Streams a chat reply while respecting Gemini's rate limits, yielding
+    response chunks as they arrive. Waits out 429 responses (honoring any
+    retry delay) instead of immediately hammering the API again.
     """
-    # ESPN player search endpoint
-    search_url = "https://site.api.espn.com/apis/common/v3/search"
-    params = {
-        "query": player_name,
-        "limit": 5,
-        "type": "player",
-        "sport": "football",
-        "league": "nfl"
-    }
-    
-    try:
-        response = requests.get(search_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        results = data.get("results", [])
-        if not results:
-            return f"No player found matching '{player_name}'. Please check the spelling and try again."
-        
-        # Get the first matching player
-        player = results[0]
-        player_display = player.get("displayName", player_name)
-        player_id = player.get("id")
-        team = player.get("team", {}).get("abbreviation", "N/A")
-        position = player.get("position", {}).get("abbreviation", "N/A")
-        
-        output = f"👤 {player_display}\n" + "="*50 + "\n"
-        output += f"Team: {team} | Position: {position}\n"
-        
-        # Try to get detailed player stats
-        if player_id:
-            stats_url = f"https://site.api.espn.com/apis/site/v2/sports/football/nfl/athletes/{player_id}"
-            try:
-                stats_response = requests.get(stats_url, timeout=10)
-                stats_data = stats_response.json()
-                
-                # Extract season stats if available
-                athlete_stats = stats_data.get("athlete", {}).get("statistics", [])
-                if athlete_stats:
-                    output += "\n2025 Season Stats:\n"
-                    for stat in athlete_stats[:5]:  # Show top 5 stats
-                        stat_name = stat.get("displayName", "")
-                        stat_value = stat.get("displayValue", "")
-                        if stat_name and stat_value:
-                            output += f"  • {stat_name}: {stat_value}\n"
-            except:
-                pass  # Stats not critical, continue without them
-        
-        return output
-    
-    except Exception as e:
-        return f"Error searching for player '{player_name}': {str(e)}"
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        RATE_LIMITER.wait_if_throttled()
+        started = False
+        try:
+            for chunk in chat.send_message_stream(message):
+                started = True
+                yield chunk
+        except errors.APIError as e:
+            # Only retry if nothing was shown yet, otherwise the reply would repeat
+            if started or e.code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            RATE_LIMITER.record_rate_limit(_retry_after(e))
+            print(f"\n⏳ Gemini rate limit hit, retrying in {RATE_LIMITER.wait_time():.0f}s...")
+            continue
+        RATE_LIMITER.record_success()
+        return
+
+
+def _chunk_text(chunk) -> str:
+    """
+    Text parts of a streamed chunk. Avoids chunk.text, which logs a warning
+    for the function-call-only chunks yielded during automatic function calling.
+    """
+    if not chunk.candidates or not chunk.candidates[0].content:
+        return ""
+    return "".join(part.text for part in (chunk.candidates[0].content.parts or []) if part.text)
 
 
 # ------------------ CHAT IMPLEMENTATION ------------------
 
+# Built once at import; the system prompt and tool declarations never change
+CHAT_CONFIG = types.GenerateContentConfig(
+    system_instruction=SEASON_CONTEXT,
+    tools=[
+        get_nfl_scoreboard,
+        get_league_leaders,
+        get_team_stats,
+        get_multiple_team_stats,
+        search_player_stats
+    ],
+    automatic_function_calling=types.AutomaticFunctionCallingConfig(
+        disable=False
+    ),
+    temperature=0.7,
+    top_p=0.95
+)
+
+
+def _record_cached_turn(chat, user_input: str, reply: str):
+    """
+    Returns a chat whose history includes a turn that was answered from the
+    cache, so the model still remembers that exchange on later turns.
+    """
+    history = chat.get_history() + [
+        types.Content(role="user", parts=[types.Part(text=user_input)]),
+        types.Content(role="model", parts=[types.Part(text=reply)]),
+    ]
+    return client.chats.create(model=MODEL, config=CHAT_CONFIG, history=history)
+
+
 def run_nfl_chat():
     """Main chat loop for the NFL AI Analyst."""
     
@@ -307,24 +429,14 @@ def run_nfl_chat():
     print("\nType 'exit' or 'quit' to end the session.")
     print("="*60 + "\n")
     
+    # Do the ESPN handshake in the background while the user reads the banner
+    submit_background(warm_connection)
+    
     try:
         # Create a chat session with automatic function calling
         chat = client.chats.create(
-            model="gemini-2.0-flash-exp",
-            config=types.GenerateContentConfig(
-                system_instruction=SEASON_CONTEXT,
-                tools=[
-                    get_nfl_scoreboard,
-                    get_league_leaders,
-                    get_team_stats,
-                    search_player_stats
-                ],
-                automatic_function_calling=types.AutomaticFunctionCallingConfig(
-                    disable=False
-                ),
-                temperature=0.7,
-                top_p=0.95
-            )
+            model=MODEL,
+            config=CHAT_CONFIG
         )
         
         while True:
@@ -334,15 +446,62 @@ def run_nfl_chat():
                 if not user_input:
                     continue
                 
-                if user_input.lower() in ["exit", "quit", "bye", "goodbye"]:
+                if user_input.lower() in EXIT_COMMANDS:
                     print("\n🏈 Thanks for chatting! Enjoy the games! 🏈\n")
                     break
                 
-                # Send message and get response
-                response = chat.send_message(user_input)
+                # Identical prompts are answered straight from the hash cache,
+                # then near-identical ones from the semantic cache. The semantic
+                # cache only covers opening questions, since a short follow-up
+                # like "why?" means something different in every conversation.
+                # Live-data questions are never cached, so skip embedding them.
+                intent = detect_intent(user_input)
+                history = chat.get_history(curated=True)
+                key = _cache_key(user_input, history)
+                cached = lookup_exact_cache(key)
+                embedding = None
+                first_turn = not history
+                if not cached and first_turn and intent == "general":
+                    embedding = _embed(user_input)
+                    cached = lookup_semantic_cache(embedding)
+                if cached:
+                    print(f"\n🤖 NFL Analyst: {cached}")
+                    chat = _record_cached_turn(chat, user_input, cached)
+                else:
+                    # For live-data questions, hand Gemini the data up front so it
+                    # doesn't need a sequential round-trip per tool call
+                    message = user_input
+                    live_context = ""
+                    if intent != "general":
+                        live_context = prefetch_live_context()
+                    if live_context:
+                        message = (f"Live data (already fetched, use it instead of calling tools "
+                                   f"where it covers the question):\n{live_context}\n\n"
+                                   f"Question: {user_input}")
+                    
+                    # Stream the AI's response so text appears as soon as it's generated
+                    print("\n🤖 NFL Analyst: ", end="", flush=True)
+                    parts = []
+                    used_live_data = intent != "general"
+                    for chunk in stream_with_backpressure(chat, message):
+                        used_live_data = used_live_data or _used_live_data(chunk)
+                        text = _chunk_text(chunk)
+                        if text:
+                            print(text, end="", flush=True)
+                            parts.append(text)
+                    print()
+                    
+                    # Live-data questions and answers built from tool data go stale,
+                    # even when the prefetch timed out, so only cache the rest
+                    if not used_live_data:
+                        reply = "".join(parts)
+                        store_exact_cache(key, reply)
+                        store_semantic_cache(embedding, reply)
                 
-                # Display the AI's response
-                print(f"\n🤖 NFL Analyst: {response.text}")
+                # Refresh live data while the user reads and types, so the next
+                # question finds it in the TTL cache. Runs after every answered
+                # turn, including ones served from the response caches.
+                warm_live_data()
                 
             except KeyboardInterrupt:
                 print("\n\n🏈 Chat interrupted. Goodbye! 🏈\n")
@@ -354,6 +513,10 @@ def run_nfl_chat():
     except Exception as e:
         print(f"\n❌ Failed to initialize chat: {str(e)}")
         print("Please check your API key and internet connection.\n")
+    
+    finally:
+        # Drop queued refreshes so exit doesn't wait on background fetches
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 
 # ------------------ MAIN ENTRY POINT ------------------